@@ -1,8 +1,11 @@
 import os
 import tempfile
 import sqlite3
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import namedtuple
 
+import pandas as pd
 import streamlit as st
 from streamlit_autorefresh import st_autorefresh  # pip install streamlit-autorefresh
 
@@ -32,7 +35,7 @@ ADMIN_PIN = "hradmin"
 DB_PATH = os.path.join(tempfile.gettempdir(), "engagement_scrabble.db")
 
 # 13 SCRABBLE WORDS + CLUES
-WORDS = [
+_RAW_WORDS = [
     {
         "index": 0,
         "scramble": "GNEGAEMNET",
@@ -113,22 +116,128 @@ WORDS = [
     },
 ]
 
+# Immutable word records with the answer upper-cased once at load time
+Word = namedtuple("Word", "index scramble answer clue")
+WORDS = tuple(
+    Word(
+        index=w["index"],
+        scramble=w["scramble"],
+        answer=w["answer"].upper(),
+        clue=w["clue"],
+    )
+    for w in _RAW_WORDS
+)
+
 TOTAL_WORDS = len(WORDS)
 TIME_LIMIT = 30  # seconds per word
 ACTIVE_WINDOW_MINUTES = 10  # for live participants counter
+LAST_SEEN_FLUSH_SECONDS = 2  # how often buffered heartbeats are written to the DB
+ACTIVE_REFRESH_MS = 1000  # autorefresh while words remain (and for the host view)
+IDLE_REFRESH_MS = 5000  # autorefresh for players once every word has been played
+READ_CACHE_TTL = 1.0  # seconds; read queries are shared by all sessions within this window
+STATEMENT_CACHE_SIZE = 256  # comfortably above the number of distinct statements below
+
+# -------------------------
+# SQL
+# -------------------------
+# Hot-path statements live here so every call passes the same string and
+# hits the connection's prepared-statement cache.
+SQL_GAME_STATE_VERSION = "SELECT updated_at FROM game_state WHERE id = 1"
+
+SQL_GAME_STATE = (
+    "SELECT current_word_index, question_start_time, is_active FROM game_state WHERE id = 1"
+)
+
+SQL_PLAYER_BY_NAME = "SELECT id FROM players WHERE name = ?"
+
+SQL_INSERT_PLAYER = "INSERT INTO players (name, last_seen) VALUES (?, ?)"
+
+SQL_UPDATE_LAST_SEEN = "UPDATE players SET last_seen = ? WHERE id = ?"
+
+SQL_PLAYER_IDS = "SELECT id FROM players"
+
+SQL_COUNT_LIVE = "SELECT COUNT(*) FROM players WHERE last_seen >= ?"
+
+SQL_LIVE_NAMES = (
+    "SELECT name FROM players WHERE last_seen >= ? ORDER BY name COLLATE NOCASE"
+)
+
+SQL_SAVE_SCORE = """
+    INSERT INTO scores (player_id, word_index, correct, time_taken, answered_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(player_id, word_index) DO UPDATE SET
+        correct = excluded.correct,
+        time_taken = excluded.time_taken,
+        answered_at = excluded.answered_at
+"""
+
+SQL_OVERALL_LEADERBOARD = """
+    SELECT
+        RANK() OVER (
+            ORDER BY COUNT(s.player_id) DESC, COALESCE(SUM(s.time_taken), 0.0) ASC
+        ) AS "Rank",
+        p.name AS "Player",
+        COUNT(s.player_id) AS "Correct answers",
+        ROUND(COALESCE(SUM(s.time_taken), 0.0), 2) AS "Total time (s, correct only)"
+    FROM players p
+    LEFT JOIN scores s ON s.player_id = p.id AND s.correct = 1
+    GROUP BY p.id
+    ORDER BY 1, p.name COLLATE NOCASE
+"""
+
+SQL_WORD_LEADERBOARD = """
+    SELECT p.name, s.time_taken
+    FROM scores s
+    JOIN players p ON p.id = s.player_id
+    WHERE s.word_index = ? AND s.correct = 1
+    ORDER BY s.time_taken ASC
+"""
+
+SQL_LIVE_AND_ANSWER_STATS = """
+    SELECT
+        (SELECT COUNT(*) FROM players WHERE last_seen >= ?) AS live,
+        (SELECT COUNT(*) FROM scores WHERE word_index = ?) AS total,
+        (SELECT SUM(correct) FROM scores WHERE word_index = ?) AS correct_count
+"""
 
 
 # -------------------------
 # DB HELPERS
 # -------------------------
-@st.cache_resource
-def get_connection():
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+def now_ms() -> int:
+    """Current UNIX time in integer milliseconds, the format all timestamps are stored in."""
+    return int(time.time() * 1000)
+
+
+def open_connection():
+    # Keep the default isolation level: helpers rely on explicit commits, and
+    # autocommit would make batched writes inside `with conn:` commit row by row.
+    conn = sqlite3.connect(
+        DB_PATH,
+        check_same_thread=False,
+        timeout=30,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
     conn.execute("PRAGMA foreign_keys = 1")
+    # WAL lets the 1s autorefresh reads from every session proceed while a write is in flight
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA busy_timeout = 30000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -20000")
+    conn.execute("PRAGMA mmap_size = 268435456")
     return conn
 
 
+@st.cache_resource
+def get_connection():
+    """Connection shared by all script threads."""
+    return open_connection()
+
+
+@st.cache_resource
 def init_db():
+    """Create schema, indexes and the game_state row once per server process."""
     conn = get_connection()
     cur = conn.cursor()
 
@@ -139,7 +248,7 @@ def init_db():
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT UNIQUE NOT NULL,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            last_seen TIMESTAMP
+            last_seen INTEGER
         )
         """
     )
@@ -153,7 +262,7 @@ def init_db():
             word_index INTEGER NOT NULL,
             correct INTEGER NOT NULL,
             time_taken REAL,
-            answered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            answered_at INTEGER,
             UNIQUE(player_id, word_index),
             FOREIGN KEY(player_id) REFERENCES players(id)
         )
@@ -166,9 +275,50 @@ def init_db():
         CREATE TABLE IF NOT EXISTS game_state (
             id INTEGER PRIMARY KEY CHECK (id = 1),
             current_word_index INTEGER NOT NULL DEFAULT 0,
-            question_start_time TIMESTAMP,
-            is_active INTEGER NOT NULL DEFAULT 0
+            question_start_time INTEGER,
+            is_active INTEGER NOT NULL DEFAULT 0,
+            updated_at INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+
+    # Older databases predate the updated_at version column
+    cur.execute("PRAGMA table_info(game_state)")
+    if "updated_at" not in {col[1] for col in cur.fetchall()}:
+        cur.execute(
+            "ALTER TABLE game_state ADD COLUMN updated_at INTEGER NOT NULL DEFAULT 0"
+        )
+
+    # Older databases stored these as ISO text; convert them to epoch milliseconds
+    for table, column in (
+        ("players", "last_seen"),
+        ("scores", "answered_at"),
+        ("game_state", "question_start_time"),
+    ):
+        cur.execute(
+            f"""
+            UPDATE {table}
+            SET {column} = CAST((julianday({column}) - 2440587.5) * 86400000 AS INTEGER)
+            WHERE typeof({column}) = 'text'
+            """
         )
+
+    # Indexes for the per-rerun live-player and per-word lookups
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_players_last_seen ON players(last_seen)"
+    )
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_scores_word_correct_time
+        ON scores(word_index, correct, time_taken)
+        """
+    )
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_scores_player ON scores(player_id)")
+    # Partial index so leaderboard aggregates only walk correct answers
+    cur.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_scores_correct
+        ON scores(player_id, time_taken) WHERE correct = 1
         """
     )
 
@@ -181,30 +331,66 @@ def init_db():
     )
 
     conn.commit()
+    cur.execute("ANALYZE")
+    return True
+
+
+def clear_read_caches():
+    """Drop cached query results so the next rerun sees a write immediately."""
+    get_game_state_version.clear()
+    count_live_players.clear()
+    get_live_players_names.clear()
+    get_player_ids.clear()
+    get_overall_leaderboard.clear()
+    get_current_word_leaderboard.clear()
+    get_current_word_leaderboard_df.clear()
+    get_live_and_answer_stats.clear()
+
+
+@st.cache_resource
+def get_game_state_cache():
+    """In-process copy of the game_state row, keyed by its updated_at version."""
+    return {"entry": (None, None), "lock": threading.Lock()}
+
+
+@st.cache_data(ttl=READ_CACHE_TTL, show_spinner=False)
+def get_game_state_version():
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(SQL_GAME_STATE_VERSION)
+    row = cur.fetchone()
+    return row[0] if row else None
 
 
 def get_game_state():
+    """Current game state plus the seconds elapsed since the round started."""
+    cache = get_game_state_cache()
+    version = get_game_state_version()
+    cached_version, state = cache["entry"]
+    if version is None or cached_version != version:
+        with cache["lock"]:
+            cached_version, state = cache["entry"]
+            if version is None or cached_version != version:
+                state = _load_game_state()
+                cache["entry"] = (version, state)
+
+    start_ms = state["question_start_time"]
+    elapsed = (now_ms() - start_ms) / 1000.0 if start_ms is not None else None
+    return {**state, "elapsed": elapsed}
+
+
+def _load_game_state():
     conn = get_connection()
     cur = conn.cursor()
-    cur.execute(
-        "SELECT current_word_index, question_start_time, is_active FROM game_state WHERE id = 1"
-    )
+    cur.execute(SQL_GAME_STATE)
     row = cur.fetchone()
     if not row:
         return {"current_word_index": 0, "question_start_time": None, "is_active": 0}
 
     idx, q_time, is_active = row
-    if q_time:
-        if isinstance(q_time, str):
-            start_dt = datetime.fromisoformat(q_time)
-        else:
-            start_dt = q_time
-    else:
-        start_dt = None
-
     return {
         "current_word_index": idx,
-        "question_start_time": start_dt,
+        "question_start_time": q_time,
         "is_active": bool(is_active),
     }
 
@@ -226,59 +412,91 @@ def set_game_state(current_word_index=None, question_start_time=None, is_active=
         params.append(int(is_active))
 
     if fields:
+        fields.append("updated_at = ?")
+        params.append(time.monotonic_ns())
         sql = f"UPDATE game_state SET {', '.join(fields)} WHERE id = 1"
         cur.execute(sql, tuple(params))
         conn.commit()
+        clear_read_caches()
 
 
 def get_or_create_player(name: str):
     conn = get_connection()
     cur = conn.cursor()
 
-    cur.execute("SELECT id FROM players WHERE name = ?", (name,))
+    cur.execute(SQL_PLAYER_BY_NAME, (name,))
     row = cur.fetchone()
     if row:
         player_id = row[0]
     else:
-        cur.execute(
-            "INSERT INTO players (name, last_seen) VALUES (?, ?)",
-            (name, datetime.utcnow()),
-        )
+        cur.execute(SQL_INSERT_PLAYER, (name, now_ms()))
         conn.commit()
         player_id = cur.lastrowid
+        clear_read_caches()
 
     return player_id
 
 
-def update_last_seen(player_id: int):
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(
-        "UPDATE players SET last_seen = ? WHERE id = ?",
-        (datetime.utcnow(), player_id),
+@st.cache_resource
+def get_last_seen_buffer():
+    """Process-wide heartbeat buffer, flushed by a single background thread."""
+    buffer = {"pending": {}, "lock": threading.Lock()}
+    flusher = threading.Thread(
+        target=_flush_last_seen_forever, args=(buffer,), daemon=True
     )
-    conn.commit()
+    flusher.start()
+    return buffer
+
+
+def flush_last_seen(conn, buffer):
+    with buffer["lock"]:
+        items = list(buffer["pending"].items())
+        buffer["pending"].clear()
+    if not items:
+        return
+
+    try:
+        with conn:
+            conn.executemany(
+                SQL_UPDATE_LAST_SEEN, [(ts, pid) for pid, ts in items]
+            )
+    except sqlite3.Error:
+        # Put the heartbeats back (unless a newer one arrived) and retry next tick
+        with buffer["lock"]:
+            for pid, ts in items:
+                buffer["pending"].setdefault(pid, ts)
+
+
+def _flush_last_seen_forever(buffer):
+    # A dedicated connection: sharing get_connection() would let this thread's
+    # commits land in the middle of another thread's transaction.
+    conn = open_connection()
+    while True:
+        time.sleep(LAST_SEEN_FLUSH_SECONDS)
+        flush_last_seen(conn, buffer)
+
+
+def update_last_seen(player_id: int):
+    buffer = get_last_seen_buffer()
+    with buffer["lock"]:
+        buffer["pending"][player_id] = now_ms()
 
 
+@st.cache_data(ttl=READ_CACHE_TTL, show_spinner=False)
 def count_live_players():
     conn = get_connection()
     cur = conn.cursor()
-    cutoff = datetime.utcnow() - timedelta(minutes=ACTIVE_WINDOW_MINUTES)
-    cur.execute(
-        "SELECT COUNT(*) FROM players WHERE last_seen >= ?",
-        (cutoff,),
-    )
+    cutoff = now_ms() - ACTIVE_WINDOW_MINUTES * 60 * 1000
+    cur.execute(SQL_COUNT_LIVE, (cutoff,))
     return cur.fetchone()[0]
 
 
+@st.cache_data(ttl=READ_CACHE_TTL, show_spinner=False)
 def get_live_players_names():
     conn = get_connection()
     cur = conn.cursor()
-    cutoff = datetime.utcnow() - timedelta(minutes=ACTIVE_WINDOW_MINUTES)
-    cur.execute(
-        "SELECT name FROM players WHERE last_seen >= ? ORDER BY name COLLATE NOCASE",
-        (cutoff,),
-    )
+    cutoff = now_ms() - ACTIVE_WINDOW_MINUTES * 60 * 1000
+    cur.execute(SQL_LIVE_NAMES, (cutoff,))
     rows = cur.fetchall()
     return [r[0] for r in rows]
 
@@ -287,71 +505,84 @@ def save_score(player_id: int, word_index: int, correct: bool, time_taken: float
     conn = get_connection()
     cur = conn.cursor()
     cur.execute(
-        """
-        INSERT OR REPLACE INTO scores (player_id, word_index, correct, time_taken, answered_at)
-        VALUES (?, ?, ?, ?, ?)
-        """,
-        (player_id, word_index, int(correct), time_taken, datetime.utcnow()),
+        SQL_SAVE_SCORE,
+        (player_id, word_index, int(correct), time_taken, now_ms()),
     )
     conn.commit()
+    clear_read_caches()
 
 
+@st.cache_data(ttl=READ_CACHE_TTL, show_spinner=False)
 def get_overall_leaderboard():
+    """Ranked overall standings as a DataFrame, ready to hand to st.dataframe."""
     conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT
-            p.name,
-            COALESCE(SUM(CASE WHEN s.correct = 1 THEN 1 ELSE 0 END), 0) AS correct_answers,
-            COALESCE(SUM(CASE WHEN s.correct = 1 THEN s.time_taken ELSE 0 END), 0.0) AS total_time
-        FROM players p
-        LEFT JOIN scores s ON p.id = s.player_id
-        GROUP BY p.id
-        ORDER BY correct_answers DESC, total_time ASC
-        """
-    )
-    return cur.fetchall()
+    return pd.read_sql_query(SQL_OVERALL_LEADERBOARD, conn)
 
 
+@st.cache_data(ttl=READ_CACHE_TTL, show_spinner=False)
 def get_current_word_leaderboard(word_index: int):
     conn = get_connection()
     cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT p.name, s.time_taken
-        FROM scores s
-        JOIN players p ON p.id = s.player_id
-        WHERE s.word_index = ? AND s.correct = 1
-        ORDER BY s.time_taken ASC
-        """,
-        (word_index,),
-    )
+    cur.execute(SQL_WORD_LEADERBOARD, (word_index,))
     return cur.fetchall()
 
 
-def get_answer_stats(word_index: int):
+@st.cache_data(ttl=READ_CACHE_TTL, show_spinner=False)
+def get_current_word_leaderboard_df(word_index: int):
+    """Per-word fastest answers as a DataFrame, built once per cache window."""
+    rows = get_current_word_leaderboard(word_index)
+    return pd.DataFrame(
+        {
+            "Rank": range(1, len(rows) + 1),
+            "Player": [name for name, _ in rows],
+            "Time (s)": [round(time_taken, 2) for _, time_taken in rows],
+        }
+    )
+
+
+@st.cache_data(ttl=READ_CACHE_TTL, show_spinner=False)
+def get_live_and_answer_stats(word_index: int):
+    """Live player count plus answer totals for one word, in a single query."""
     conn = get_connection()
     cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT
-            COUNT(*) AS total,
-            SUM(CASE WHEN correct = 1 THEN 1 ELSE 0 END) AS correct_count
-        FROM scores
-        WHERE word_index = ?
-        """,
-        (word_index,),
+    cutoff = now_ms() - ACTIVE_WINDOW_MINUTES * 60 * 1000
+    cur.execute(SQL_LIVE_AND_ANSWER_STATS, (cutoff, word_index, word_index))
+    live, total, correct = cur.fetchone()
+    correct = correct or 0
+    return live, total, correct, total - correct
+
+
+AdminSnapshot = namedtuple(
+    "AdminSnapshot",
+    "game_state live_players live_names total_answers correct_answers "
+    "incorrect_answers overall_leaderboard word_leaderboard",
+)
+
+
+def fetch_admin_snapshot():
+    """Everything the admin sidebar shows, gathered in one pass per rerun."""
+    game_state = get_game_state()
+    idx = game_state["current_word_index"]
+    live, total, correct, incorrect = get_live_and_answer_stats(idx)
+    word_rows = get_current_word_leaderboard(idx) if idx < TOTAL_WORDS else []
+    return AdminSnapshot(
+        game_state=game_state,
+        live_players=live,
+        live_names=get_live_players_names(),
+        total_answers=total,
+        correct_answers=correct,
+        incorrect_answers=incorrect,
+        overall_leaderboard=get_overall_leaderboard(),
+        word_leaderboard=word_rows,
     )
-    row = cur.fetchone()
-    total = row[0] if row and row[0] is not None else 0
-    correct = row[1] if row and row[1] is not None else 0
-    incorrect = total - correct
-    return total, correct, incorrect
 
 
 def reset_all():
     """Delete all scores, all players, and reset game_state to initial."""
+    buffer = get_last_seen_buffer()
+    with buffer["lock"]:
+        buffer["pending"].clear()
+
     conn = get_connection()
     cur = conn.cursor()
     cur.execute("DELETE FROM scores")
@@ -361,18 +592,41 @@ def reset_all():
         UPDATE game_state
         SET current_word_index = 0,
             question_start_time = NULL,
-            is_active = 0
+            is_active = 0,
+            updated_at = ?
         WHERE id = 1
-        """
+        """,
+        (time.monotonic_ns(),),
     )
     conn.commit()
-
-
-def player_exists(player_id: int) -> bool:
+    clear_read_caches()
+
+    # Reclaim the freed pages, then trim the WAL that VACUUM wrote into. A private
+    # connection keeps other sessions' open transactions from blocking VACUUM.
+    maintenance_conn = open_connection()
+    try:
+        maintenance_conn.execute("VACUUM")
+        maintenance_conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except sqlite3.OperationalError as e:
+        st.warning(f"Game was reset, but the database could not be compacted: {e}")
+    finally:
+        maintenance_conn.close()
+
+
+@st.cache_data(ttl=READ_CACHE_TTL, show_spinner=False)
+def get_player_ids():
     conn = get_connection()
     cur = conn.cursor()
-    cur.execute("SELECT 1 FROM players WHERE id = ?", (player_id,))
-    return cur.fetchone() is not None
+    cur.execute(SQL_PLAYER_IDS)
+    return frozenset(r[0] for r in cur.fetchall())
+
+
+def touch_player(player_id: int) -> bool:
+    """Record a heartbeat for the player; False if they no longer exist (e.g. after a reset)."""
+    if player_id not in get_player_ids():
+        return False
+    update_last_seen(player_id)
+    return True
 
 
 # -------------------------
@@ -403,10 +657,8 @@ def render_admin_controls():
         return
 
     with st.sidebar.expander("🧑‍🏫 Host / Admin controls", expanded=True):
-        live_players_admin = count_live_players()
-        st.metric("Live participants", live_players_admin)
-
         if not st.session_state.is_admin:
+            st.metric("Live participants", count_live_players())
             pin = st.text_input("Enter admin PIN:", type="password", key="admin_pin")
             if st.button("Unlock admin", key="unlock_admin"):
                 if pin == ADMIN_PIN:
@@ -416,9 +668,11 @@ def render_admin_controls():
                 else:
                     st.error("Incorrect PIN.")
         else:
+            snapshot = fetch_admin_snapshot()
+            st.metric("Live participants", snapshot.live_players)
             st.success("Admin mode active ✅")
 
-            game_state = get_game_state()
+            game_state = snapshot.game_state
             idx = game_state["current_word_index"]
             start_time = game_state["question_start_time"]
             is_active = game_state["is_active"]
@@ -426,15 +680,13 @@ def render_admin_controls():
             if idx < TOTAL_WORDS:
                 word_data = WORDS[idx]
                 st.markdown(f"### 🎯 Current word: **{idx + 1} / {TOTAL_WORDS}**")
-                st.write(f"Scramble: `{word_data['scramble']}`")
-                st.write(f"Clue: {word_data['clue']}")
+                st.write(f"Scramble: `{word_data.scramble}`")
+                st.write(f"Clue: {word_data.clue}")
             else:
                 st.write("All words completed.")
 
-            if start_time:
-                now = datetime.utcnow()
-                elapsed = (now - start_time).total_seconds()
-                time_elapsed = int(elapsed)
+            if start_time is not None:
+                time_elapsed = int(game_state["elapsed"])
                 time_left = max(0, TIME_LIMIT - time_elapsed)
             else:
                 time_elapsed = 0
@@ -447,12 +699,12 @@ def render_admin_controls():
                 st.metric("⏱ Remaining (s)", time_left)
 
             if idx < TOTAL_WORDS and start_time is not None and time_left <= 0:
-                st.markdown(f"✅ Correct word: **{WORDS[idx]['answer']}**")
+                st.markdown(f"✅ Correct word: **{WORDS[idx].answer}**")
             elif idx < TOTAL_WORDS:
                 st.caption("Correct word will appear here after time is over.")
 
             if not is_active or start_time is None:
-                names = get_live_players_names()
+                names = snapshot.live_names
                 st.markdown("**✅ Logged-in players (waiting):**")
                 if names:
                     st.write(", ".join(names))
@@ -460,11 +712,10 @@ def render_admin_controls():
                     st.write("No players have joined yet.")
 
             if idx < TOTAL_WORDS:
-                total_ans, correct_ans, incorrect_ans = get_answer_stats(idx)
                 st.markdown("**📊 This word stats:**")
-                st.write(f"- Total answers: **{total_ans}**")
-                st.write(f"- Correct: **{correct_ans}**")
-                st.write(f"- Incorrect: **{incorrect_ans}**")
+                st.write(f"- Total answers: **{snapshot.total_answers}**")
+                st.write(f"- Correct: **{snapshot.correct_answers}**")
+                st.write(f"- Incorrect: **{snapshot.incorrect_answers}**")
 
             st.markdown("---")
             if idx < TOTAL_WORDS:
@@ -472,7 +723,7 @@ def render_admin_controls():
                 if not is_active:
                     if st.button("▶️ Start round (30 seconds)", key="admin_start_round"):
                         set_game_state(
-                            question_start_time=datetime.utcnow(), is_active=1
+                            question_start_time=now_ms(), is_active=1
                         )
                         st.rerun()
                 else:
@@ -493,14 +744,17 @@ def render_admin_controls():
             st.markdown("---")
             st.markdown("### 🌈 Live Overall Leaderboard")
 
-            rows = get_overall_leaderboard()
-            if rows:
-                max_correct = max(int(r[1]) for r in rows) or 1
-                for rank, (name, correct_count, total_time) in enumerate(
-                    rows[:5], start=1
+            overall_df = snapshot.overall_leaderboard
+            if not overall_df.empty:
+                max_correct = int(overall_df["Correct answers"].max()) or 1
+                html_parts = []
+                # Number the cards by position so each medal appears once, even when
+                # the table's RANK() has ties (e.g. everyone on 0 at the start)
+                top_rows = overall_df.head(5).itertuples(index=False)
+                for rank, (_, name, correct_count, total_time) in enumerate(
+                    top_rows, start=1
                 ):
                     correct_count = int(correct_count)
-                    total_time = round(total_time, 2)
 
                     if rank == 1:
                         bg = "#FFD700"
@@ -517,7 +771,7 @@ def render_admin_controls():
 
                     fill = int((correct_count / max_correct) * 100)
 
-                    st.markdown(
+                    html_parts.append(
                         f"""
                         <div style="
                             background-color:{bg};
@@ -537,16 +791,18 @@ def render_admin_controls():
                                 "></div>
                             </div>
                         </div>
-                        """,
-                        unsafe_allow_html=True,
+                        """
                     )
+                # One markdown element for all rows instead of one per player
+                st.markdown("".join(html_parts), unsafe_allow_html=True)
             else:
                 st.write("No scores yet. Be the first to answer!")
 
             if idx < TOTAL_WORDS:
                 st.markdown("### ⚡ Fastest on this word")
-                word_rows = get_current_word_leaderboard(idx)
+                word_rows = snapshot.word_leaderboard
                 if word_rows:
+                    html_parts = []
                     for rank, (name, time_taken) in enumerate(word_rows[:5], start=1):
                         time_taken = round(time_taken, 2)
                         if rank == 1:
@@ -556,7 +812,7 @@ def render_admin_controls():
                             chip_color = "#FFF9C4"
                             icon = "⏱"
 
-                        st.markdown(
+                        html_parts.append(
                             f"""
                             <div style="
                                 background-color:{chip_color};
@@ -567,9 +823,9 @@ def render_admin_controls():
                             ">
                                 <strong>{icon} {rank}. {name}</strong> – {time_taken}s
                             </div>
-                            """,
-                            unsafe_allow_html=True,
+                            """
                         )
+                    st.markdown("".join(html_parts), unsafe_allow_html=True)
                 else:
                     st.write("No correct answers for this word yet.")
 
@@ -584,7 +840,7 @@ def render_admin_controls():
 # LEADERBOARD & FEEDBACK
 # -------------------------
 def show_answer_feedback(word_data):
-    correct_answer = word_data["answer"].upper()
+    correct_answer = word_data.answer
     if st.session_state.last_answer_correct:
         st.success(
             f"✅ Correct! The word was **{correct_answer}**.\n\n"
@@ -605,38 +861,18 @@ def show_answer_feedback(word_data):
 def show_leaderboard_section(current_word_index: int | None = None):
     st.subheader("🏆 Leaderboard")
 
-    rows = get_overall_leaderboard()
-    if rows:
+    overall_df = get_overall_leaderboard()
+    if not overall_df.empty:
         st.markdown("**Overall ranking (all words):**")
-        overall_data = []
-        for rank, row in enumerate(rows, start=1):
-            name, correct_answers, total_time = row
-            overall_data.append(
-                {
-                    "Rank": rank,
-                    "Player": name,
-                    "Correct answers": int(correct_answers),
-                    "Total time (s, correct only)": round(total_time, 2),
-                }
-            )
-        st.table(overall_data)
+        st.dataframe(overall_df, hide_index=True, use_container_width=True)
     else:
         st.write("No scores yet. Be the first to answer!")
 
     if current_word_index is not None:
         st.markdown("**Fastest correct answers for this word:**")
-        word_rows = get_current_word_leaderboard(current_word_index)
-        if word_rows:
-            per_word_data = []
-            for rank, (name, time_taken) in enumerate(word_rows, start=1):
-                per_word_data.append(
-                    {
-                        "Rank": rank,
-                        "Player": name,
-                        "Time (s)": round(time_taken, 2),
-                    }
-                )
-            st.table(per_word_data)
+        word_df = get_current_word_leaderboard_df(current_word_index)
+        if not word_df.empty:
+            st.dataframe(word_df, hide_index=True, use_container_width=True)
         else:
             st.write("No correct answers for this word yet.")
 
@@ -677,25 +913,23 @@ def show_admin_main_view():
         st.markdown(
             f"""
             #### 🔤 Upcoming scrabble word
-            **`{word_data['scramble']}`**
+            **`{word_data.scramble}`**
             
-            💡 **Clue:** {word_data['clue']}
+            💡 **Clue:** {word_data.clue}
             """
         )
-        show_leaderboard_section(current_word_index=word_data["index"])
+        show_leaderboard_section(current_word_index=word_data.index)
         return
 
-    now = datetime.utcnow()
-    elapsed = (now - start_time).total_seconds()
-    time_elapsed = int(elapsed)
+    time_elapsed = int(game_state["elapsed"])
     time_left = max(0, TIME_LIMIT - time_elapsed)
 
     st.markdown(
         f"""
         #### 🔤 Scrabble word
-        **`{word_data['scramble']}`**
+        **`{word_data.scramble}`**
         
-        💡 **Clue:** {word_data['clue']}
+        💡 **Clue:** {word_data.clue}
         """
     )
 
@@ -708,14 +942,14 @@ def show_admin_main_view():
     if time_left <= 0:
         st.markdown("### ✅ Correct word")
         st.markdown(
-            f"<h2 style='text-align:center; color:#4CAF50;'>{word_data['answer'].upper()}</h2>",
+            f"<h2 style='text-align:center; color:#4CAF50;'>{word_data.answer}</h2>",
             unsafe_allow_html=True,
         )
     else:
         st.caption("Correct word will appear here after the time is over.")
 
     st.markdown("---")
-    show_leaderboard_section(current_word_index=word_data["index"])
+    show_leaderboard_section(current_word_index=word_data.index)
 
 
 # -------------------------
@@ -725,8 +959,9 @@ def main():
     init_db()
     init_session_state()
 
-    # 🔁 Re-run script every 1s for realtime updates in ALL sessions
-    st_autorefresh(interval=1000, key="game_autorefresh")
+    # 🔁 Projector/host view re-runs every 1s; players pick their rate below
+    if IS_ADMIN_VIEW:
+        st_autorefresh(interval=ACTIVE_REFRESH_MS, key="game_autorefresh")
 
     st.title("🧩 Employee Engagement Scrabble – Live Game")
 
@@ -760,13 +995,11 @@ def main():
     player_id = st.session_state.player_id
     player_name = st.session_state.player_name
 
-    if not player_exists(player_id):
+    if not touch_player(player_id):
         st.session_state.player_id = None
         st.session_state.player_name = None
         st.rerun()
 
-    update_last_seen(player_id)
-
     live_players = count_live_players()
 
     game_state = get_game_state()
@@ -774,6 +1007,14 @@ def main():
     start_time = game_state["question_start_time"]
     is_active = game_state["is_active"]
 
+    # Waiting players must see "Start round" promptly since the clock is server-side,
+    # so only slow down once the game is over. Keying on the round state remounts
+    # the timer only on transitions.
+    interval = ACTIVE_REFRESH_MS if current_index < TOTAL_WORDS else IDLE_REFRESH_MS
+    st_autorefresh(
+        interval=interval, key=f"refresh_{current_index}_{int(is_active)}"
+    )
+
     if st.session_state.seen_word_index != current_index:
         st.session_state.seen_word_index = current_index
         st.session_state.has_answered = False
@@ -802,31 +1043,29 @@ def main():
         st.markdown(
             f"""
             ### 🔤 Upcoming scrabble word:
-            **`{word_data['scramble']}`**
+            **`{word_data.scramble}`**
             
-            💡 **Clue:** {word_data['clue']}
+            💡 **Clue:** {word_data.clue}
             """
         )
         st.caption("You will have 30 seconds to answer after the host starts the round.")
-        show_leaderboard_section(current_word_index=word_data["index"])
+        show_leaderboard_section(current_word_index=word_data.index)
         st.stop()
 
-    now = datetime.utcnow()
-    elapsed = (now - start_time).total_seconds()
-    time_elapsed = int(elapsed)
+    time_elapsed = int(game_state["elapsed"])
     time_left = max(0, TIME_LIMIT - time_elapsed)
 
     if time_left <= 0 and not st.session_state.has_answered:
-        save_score(player_id, word_data["index"], False, None)
+        save_score(player_id, word_data.index, False, None)
         st.session_state.has_answered = True
         st.session_state.last_answer_correct = False
 
     st.markdown(
         f"""
         ### 🔤 Scrabble word:
-        **`{word_data['scramble']}`**
+        **`{word_data.scramble}`**
         
-        💡 **Clue:** {word_data['clue']}
+        💡 **Clue:** {word_data.clue}
         """
     )
 
@@ -845,12 +1084,10 @@ def main():
     )
 
     if st.button("Submit answer", disabled=disabled_input):
-        now = datetime.utcnow()
-        elapsed = (now - start_time).total_seconds()
-        time_taken = min(elapsed, TIME_LIMIT)
+        time_taken = min(game_state["elapsed"], TIME_LIMIT)
 
         user_answer = answer.strip().upper()
-        correct_answer = word_data["answer"].upper()
+        correct_answer = word_data.answer
 
         is_correct = user_answer == correct_answer and time_taken <= TIME_LIMIT
 
@@ -860,7 +1097,7 @@ def main():
 
         save_score(
             player_id,
-            word_data["index"],
+            word_data.index,
             is_correct,
             time_taken if is_correct else None,
         )
@@ -873,7 +1110,7 @@ def main():
     if st.session_state.has_answered or time_left <= 0:
         show_answer_feedback(word_data)
         st.markdown("---")
-        show_leaderboard_section(current_word_index=word_data["index"])
+        show_leaderboard_section(current_word_index=word_data.index)
         st.caption("Wait for the host to move to the next word.")
 
 